@@ -3,6 +3,11 @@
 from abc import ABC, abstractmethod
 from typing import Callable, List, Optional, Union
 
+# Valid referential actions for foreign keys
+_VALID_ACTIONS = frozenset(
+    {"NO ACTION", "RESTRICT", "CASCADE", "SET NULL", "SET DEFAULT"}
+)
+
 
 class Constraint(ABC):
     """Constraint abstract base class."""
@@ -96,21 +101,19 @@ class ForeignKey(Constraint):
         if isinstance(ref_columns, str):
             ref_columns = [ref_columns]
 
-        valid = "NO ACTION", "RESTRICT", "CASCADE", "SET NULL", "SET DEFAULT"
-        if delete and delete.upper() not in valid:
-            raise ValueError(
-                f"Invalid delete action {delete}, choose one of: {', '.join(valid)}"
-            )
-        if update and update.upper() not in valid:
-            raise ValueError(
-                f"Invalid update action {update}, choose one of:  {', '.join(valid)}"
-            )
+        valid = ", ".join(sorted(_VALID_ACTIONS))
+        if delete and delete.upper() not in _VALID_ACTIONS:
+            raise ValueError(f"Invalid delete action {delete}, choose one of: {valid}")
+        if update and update.upper() not in _VALID_ACTIONS:
+            raise ValueError(f"Invalid update action {update}, choose one of: {valid}")
 
         self.columns = columns
         self.ref_table = ref_table
         self.ref_columns = ref_columns
-        self.delete = delete
-        self.update = update
+
+        # Normalize case once, so make() can use the actions as-is
+        self.delete = delete.upper() if delete else None
+        self.update = update.upper() if update else None
 
     def make(self, id_fn: Callable) -> str:
         """
@@ -131,7 +134,7 @@ class ForeignKey(Constraint):
         name = id_fn("FK_" + "_".join(self.columns))
         columns = ", ".join([id_fn(col) for col in self.columns])
         ref_table = id_fn(self.ref_table)
-        ref_columns = ", ".join([id_fn(col) for col in self.columns])
+        ref_columns = ", ".join([id_fn(col) for col in self.ref_columns])
 
         constraint = (
             f"CONSTRAINT {name} FOREIGN KEY ({columns}) "
@@ -139,8 +142,8 @@ class ForeignKey(Constraint):
         )
 
         if self.delete:
-            constraint += f" ON DELETE {self.delete.upper()}"
+            constraint += f" ON DELETE {self.delete}"
         if self.update:
-            constraint += f" ON UPDATE {self.update.upper()}"
+            constraint += f" ON UPDATE {self.update}"
 
         return constraint
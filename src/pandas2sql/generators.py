@@ -1,8 +1,11 @@
 """Module for SQL generator classes."""
 
-import datetime as dt
-from typing import Optional, List
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, Iterator, List, Mapping, Optional, TextIO
 
+import numpy as np  # type: ignore
 import pandas as pd # type: ignore
 from pandas2sql.constraints import Constraint
 
@@ -11,19 +14,38 @@ class SQLGenerator:
     """Base class for SQL generating classes."""
 
     # Map pandas to SQL data types
-    _SQL_TYPES = {
-        "string": "TEXT",
-        "floating": "REAL",
-        "integer": "INTEGER",
-        "datetime": "TIMESTAMP",
-        "datetime64": "TIMESTAMP",
-        "date": "DATE",
-        "time": "TIME",
-        "boolean": "INTEGER",
-    }
+    _SQL_TYPES: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "string": "TEXT",
+            "floating": "REAL",
+            "integer": "INTEGER",
+            "datetime": "TIMESTAMP",
+            "datetime64": "TIMESTAMP",
+            "date": "DATE",
+            "time": "TIME",
+            "boolean": "INTEGER",
+        }
+    )
+
+    # Map unambiguous NumPy dtype kinds to inferred pandas types
+    _KIND_MAP: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "i": "integer",
+            "u": "integer",
+            "f": "floating",
+            "b": "boolean",
+            "M": "datetime64",
+            "m": "timedelta",
+        }
+    )
 
     def __init__(self, indent: int = 2) -> None:
         self._indent = int(indent)
+        self._pad = " " * self._indent
+        self._row_fns: Dict[int, Callable] = {}
+
+        # Memoize identifier escaping per instance, subclasses override _id
+        self._id = lru_cache(maxsize=None)(self._id)  # type: ignore
 
     def generate_schema(
         self,
@@ -51,16 +73,11 @@ class SQLGenerator:
 
         table_name = self._id(table_name)
 
-        # Create column specifications from dtypes
-        table_spec = [f"{col} {dtype}" for col, dtype in self._map_dtypes(df).items()]
-
-        # Create constraints (if provided)
-        if constraints:
-            for constraint in constraints:
-                table_spec.append(constraint.make(self._id))
-
-        table_spec = [" " * self._indent + line for line in table_spec]
-        table_spec_str = ",\n".join(table_spec)
+        # Create column specifications from dtypes and constraints (if provided)
+        dtypes = self._map_dtypes(df, self._infer_all(df))
+        lines = [f"{self._pad}{col} {dtype}" for col, dtype in dtypes.items()]
+        lines.extend(f"{self._pad}{c.make(self._id)}" for c in constraints or ())
+        table_spec_str = ",\n".join(lines)
 
         return f"CREATE TABLE {table_name} (\n{table_spec_str}\n);\n"
 
@@ -85,39 +102,69 @@ class SQLGenerator:
             Insert statements for the provided DataFrame.
         """
 
-        # Build statement parts and template
+        return list(self._iter_inserts(df, table_name, batch))
+
+    def stream_inserts(
+        self, df: pd.DataFrame, table_name: str, sink: TextIO, batch: int = 100
+    ) -> None:
+        """
+        Writes INSERT statements from a DataFrame to a file-like object.
+
+        Unlike ``generate_inserts``, statements are written batch by batch instead
+        of being collected in a list, which keeps memory use down when exporting
+        large DataFrames directly to a file.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Pandas DataFrame to create INSERT statements for.
+        table_name : str
+            Name for the target SQL table.
+        sink : TextIO
+            File-like object with a ``write`` method, e.g. an opened file.
+        batch : int
+            Batch size for the INSERT statement, defaults to 100.
+        """
+
+        for insert in self._iter_inserts(df, table_name, batch):
+            sink.write(insert)
+
+    def _iter_inserts(
+        self, df: pd.DataFrame, table_name: str, batch: int
+    ) -> Iterator[str]:
+        """Yields batched INSERT statements for a DataFrame."""
+
+        # Build static statement parts once
         table_name = self._id(table_name)
         column_spec = ", ".join([self._id(col) for col in df.columns])
-        insert_tmpl = (
-            "INSERT INTO {table_name} ({column_spec})\nVALUES\n{values}\n;\n\n"
-        )
-        row_tmpl = " " * self._indent + "({values})"
-
-        # Convert the data to string format
-        df = (
-            df
-            # Properly format the different data types
-            .apply(self._convert_series, axis=0)
-            # Concatenate the rows
-            .apply(
-                lambda row: row_tmpl.format(values=", ".join(row.astype(str))), axis=1
-            )
-            # Only keep the values
-            .values
-        )
-
-        inserts = []
-        for idx in range(0, len(df), batch):
-            values = df[idx : idx + batch]
-            values = ",\n".join(values)
-
-            inserts.append(
-                insert_tmpl.format(
-                    table_name=table_name, column_spec=column_spec, values=values
-                )
-            )
+        prefix = f"INSERT INTO {table_name} ({column_spec})\nVALUES\n"
+        suffix = "\n;\n\n"
+
+        # Properly format the different data types, column by column
+        dtypes = self._infer_all(df)
+        cols = [
+            self._convert_series(df[col], dtypes[col]).tolist() for col in df.columns
+        ]
+        if not cols:
+            return
+        rows = map(self._row_formatter(len(cols)), *cols)
 
-        return inserts
+        for _ in range(0, len(df), batch):
+            yield prefix + ",\n".join(islice(rows, batch)) + suffix
+
+    def _row_formatter(self, n_cols: int) -> Callable:
+        """Compiles a function formatting one row of n_cols converted values."""
+
+        if n_cols not in self._row_fns:
+            args = ", ".join(f"v{idx}" for idx in range(n_cols))
+            values = ", ".join(f"{{v{idx}}}" for idx in range(n_cols))
+            source = f'def _fmt({args}):\n    return f"{self._pad}({values})"\n'
+
+            namespace: dict = {}
+            exec(source, namespace)  # pylint: disable=exec-used
+            self._row_fns[n_cols] = namespace["_fmt"]
+
+        return self._row_fns[n_cols]
 
     @staticmethod
     def _id(identifier: str) -> str:
@@ -126,51 +173,88 @@ class SQLGenerator:
         return f'"{identifier}"'
 
     @staticmethod
-    def _quote(value: str) -> str:
-        """Quotes a (string) value for use in SQL statements."""
+    def _datetime_array(series: pd.Series, unit: str) -> pd.Series:
+        """Formats tz-naive datetimes as ISO 8601 strings using a NumPy cast."""
 
-        value = value.replace("'", "''")
-        return f"'{value}'"
+        values = series.to_numpy().astype(unit).astype(str)
+        return pd.Series(values, index=series.index)
 
-    def _date(self, value: dt.date) -> str:
-        """Formats a date value for use in SQL statements."""
+    def _lookup_dtype(self, dtype: str, col: str) -> str:
+        """Look up a single dtype in _SQL_TYPES."""
 
-        return self._quote(value.strftime("%Y-%m-%d"))
+        sql_type = self._SQL_TYPES.get(dtype)
+        if sql_type is None:
+            raise TypeError(f"Unsupported data type '{dtype}' for column '{col}'.")
+        return sql_type
 
-    def _datetime(self, value: dt.datetime) -> str:
-        """Formats a datetime value for use in SQL statements."""
+    def _infer_all(self, df: pd.DataFrame) -> dict:
+        """Infers the pandas data type of all columns in a single pass."""
 
-        return self._quote(value.strftime("%Y-%m-%dT%H:%M:%S%z"))
+        return {col: self._infer_dtype(df[col]) for col in df.columns}
 
-    def _lookup_dtype(self, dtype: str, col: str) -> str:
-        """Look up a single dtype in _SQL_TYPES."""
+    def _infer_dtype(self, series: pd.Series) -> str:
+        """Infers the pandas data type, only scanning values if necessary."""
 
-        if dtype not in self._SQL_TYPES:
-            raise TypeError(f"Unsupported data type '{dtype}' for column '{col}'.")
-        return self._SQL_TYPES[dtype]
+        dtype = self._KIND_MAP.get(series.dtype.kind)
+        if dtype is None:
+            dtype = pd._libs.lib.infer_dtype(series, skipna=True)
+        return dtype
 
-    def _map_dtypes(self, df: pd.DataFrame) -> dict:
+    def _map_dtypes(self, df: pd.DataFrame, dtypes: dict) -> dict:
         """Maps columns to SQL types."""
 
         return {
-            self._id(col): self._lookup_dtype(pd._libs.lib.infer_dtype(df[col]), col)
+            self._id(col): self._lookup_dtype(dtypes[col], col)
             for col in df.columns
         }
 
-    def _convert_series(self, series: pd.Series) -> pd.Series:
+    def _convert_series(self, series: pd.Series, dtype: str) -> pd.Series:
         """Convert values for use in SQL statements."""
 
-        dtype = pd._libs.lib.infer_dtype(series)
-
+        # Use vectorized string / datetime methods instead of per value calls
         if dtype in ["string", "categorical", "bytes"]:
-            return series.map(self._quote)
-        if dtype in ["datetime", "datetime64"]:
-            return series.map(self._datetime)
-        if dtype == "date":
-            return series.map(self._date)
+            values = series.astype(str).str.replace("'", "''", regex=False)
+            values = "'" + values + "'"
+        elif dtype in ["datetime", "datetime64"]:
+            try:
+                values = pd.to_datetime(series)
+            except ValueError:
+                # Mixed UTC offsets do not fit a single dtype, format per value
+                values = series.map(
+                    lambda value: value.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                    na_action="ignore",
+                )
+            else:
+                if values.dt.tz is None:
+                    values = self._datetime_array(values, "datetime64[s]")
+                else:
+                    values = values.dt.strftime("%Y-%m-%dT%H:%M:%S%z")
+            values = "'" + values + "'"
+        elif dtype == "date":
+            values = self._datetime_array(pd.to_datetime(series), "datetime64[D]")
+            values = "'" + values + "'"
+
+        # Keep numbers as-is, the row formatter converts them to text
+        elif dtype in ["integer", "floating"] and isinstance(series.dtype, np.dtype):
+            values = series
+
+            # Python floats would print the widened value of narrow floats
+            if series.dtype.kind == "f" and series.dtype.itemsize < 8:
+                values = pd.Series(series.to_numpy().astype(str), index=series.index)
 
         # Leave as-is and hope for the best
-        return series.astype(str)
+        else:
+            values = series.astype(str)
+
+        # Replace missing values with NULL for the whole column at once
+        mask = series.isna().to_numpy()
+        if mask.any():
+            values = pd.Series(
+                np.where(mask, "NULL", values.to_numpy(dtype=object)),
+                index=series.index,
+            )
+
+        return values
 
 
 class MSSQLGenerator(SQLGenerator):
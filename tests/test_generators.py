@@ -0,0 +1,107 @@
+"""Tests for the SQL generator classes."""
+
+import datetime as dt
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas2sql.constraints import ForeignKey
+from pandas2sql.generators import SQLiteGenerator
+
+
+@pytest.fixture
+def generator():
+    """Returns a SQLite generator instance."""
+
+    return SQLiteGenerator()
+
+
+def test_inserts_nulls(generator):
+    """Missing values are written as NULL for each data type."""
+
+    df = pd.DataFrame(
+        {
+            "int": pd.Series([1, None], dtype=object),
+            "float": [1.5, np.nan],
+            "string": ["a", None],
+            "date": [dt.date(2020, 1, 1), None],
+        }
+    )
+
+    assert generator.generate_inserts(df, "t") == [
+        'INSERT INTO "t" ("int", "float", "string", "date")\n'
+        "VALUES\n"
+        "  (1, 1.5, 'a', '2020-01-01'),\n"
+        "  (NULL, NULL, NULL, NULL)\n"
+        ";\n\n"
+    ]
+
+
+def test_inserts_mixed_offsets(generator):
+    """Datetimes with different UTC offsets keep their own offset."""
+
+    df = pd.DataFrame(
+        {
+            "datetime": [
+                dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc),
+                dt.datetime(2020, 1, 1, tzinfo=dt.timezone(dt.timedelta(hours=2))),
+                None,
+            ]
+        }
+    )
+
+    assert generator.generate_inserts(df, "t") == [
+        'INSERT INTO "t" ("datetime")\n'
+        "VALUES\n"
+        "  ('2020-01-01T00:00:00+0000'),\n"
+        "  ('2020-01-01T00:00:00+0200'),\n"
+        "  (NULL)\n"
+        ";\n\n"
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["float16", "float32", "float64"])
+def test_inserts_floats(generator, dtype):
+    """Floats are written in their shortest form, whatever their width."""
+
+    df = pd.DataFrame({"float": np.array([0.1, 1.5], dtype=dtype)})
+
+    assert generator.generate_inserts(df, "t") == [
+        'INSERT INTO "t" ("float")\nVALUES\n  (0.1),\n  (1.5)\n;\n\n'
+    ]
+
+
+def test_inserts_strings(generator):
+    """Strings are quoted as-is, with embedded quotes escaped."""
+
+    df = pd.DataFrame({"string": ["it's", "ab\x00", "x" * 1000]})
+
+    assert generator.generate_inserts(df, "t") == [
+        'INSERT INTO "t" ("string")\n'
+        "VALUES\n"
+        "  ('it''s'),\n"
+        "  ('ab\x00'),\n"
+        f"  ('{'x' * 1000}')\n"
+        ";\n\n"
+    ]
+
+
+def test_stream_inserts(generator):
+    """Streamed INSERT statements match the generated ones."""
+
+    df = pd.DataFrame({"id": range(5), "name": list("abcde")})
+    sink = io.StringIO()
+    generator.stream_inserts(df, "t", sink, batch=2)
+
+    assert sink.getvalue() == "".join(generator.generate_inserts(df, "t", batch=2))
+
+
+def test_schema_foreign_key(generator):
+    """Foreign keys reference the columns of the referenced table."""
+
+    df = pd.DataFrame({"a": [1, 2]})
+    schema = generator.generate_schema(df, "t", [ForeignKey("a", "r", "b")])
+
+    assert 'CONSTRAINT "FK_a" FOREIGN KEY ("a") REFERENCES "r"("b")' in schema